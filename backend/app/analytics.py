@@ -0,0 +1,119 @@
+# app/analytics.py
+from collections import Counter
+from datetime import datetime
+from threading import Lock
+import time
+from pymongo import UpdateOne, ASCENDING
+from pymongo.errors import BulkWriteError
+from app.database import analytics_collection, blogs_collection, projects_collection
+
+# Tracked events and the collection their item ids belong to;
+# each event is counted per item per UTC day
+EVENT_COLLECTIONS = {
+    "blog_view": blogs_collection,
+    "project_click": projects_collection,
+}
+TRACKED_EVENTS = set(EVENT_COLLECTIONS)
+COUNTER_SHARDS = 16
+KNOWN_IDS_TTL_SECONDS = 60
+
+class ShardedCounter:
+    """
+    In-memory event counters split across independently locked shards,
+    so concurrent requests rarely contend on the same lock.
+    """
+
+    def __init__(self, shards: int = COUNTER_SHARDS):
+        self._shards = [(Lock(), Counter()) for _ in range(shards)]
+
+    def incr(self, key: tuple, amount: int = 1):
+        lock, counts = self._shards[hash(key) % len(self._shards)]
+        with lock:
+            counts[key] += amount
+
+    def drain(self) -> Counter:
+        """Take every pending count, leaving the shards empty"""
+        drained = Counter()
+        for lock, counts in self._shards:
+            with lock:
+                drained.update(counts)
+                counts.clear()
+        return drained
+
+pending_counts = ShardedCounter()
+
+_known_ids = {}  # event -> (loaded_at, set of item ids)
+_known_ids_lock = Lock()
+
+def is_known_item(event: str, item_id: str) -> bool:
+    """Check an id against a cached set of existing blog/project ids"""
+    now = time.monotonic()
+    with _known_ids_lock:
+        loaded_at, ids = _known_ids.get(event, (None, None))
+    if loaded_at is None or now - loaded_at > KNOWN_IDS_TTL_SECONDS:
+        ids = {str(doc["_id"]) for doc in EVENT_COLLECTIONS[event].find({}, {"_id": 1})}
+        with _known_ids_lock:
+            _known_ids[event] = (now, ids)
+    return item_id in ids
+
+def today() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%d")
+
+def track_event(event: str, item_id: str):
+    """Count an event against today's bucket; written on the next flush"""
+    pending_counts.incr((event, item_id, today()))
+
+def flush_counts() -> int:
+    """Write all pending counts to Mongo as one bulk_write of $inc upserts"""
+    counts = pending_counts.drain()
+    if not counts:
+        return 0
+
+    keys = list(counts)
+    operations = [
+        UpdateOne(
+            {"event": event, "item_id": item_id, "day": day},
+            {"$inc": {"count": counts[(event, item_id, day)]}},
+            upsert=True
+        )
+        for event, item_id, day in keys
+    ]
+    try:
+        analytics_collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as e:
+        # Unordered writes: everything except the failed operations was applied
+        write_errors = e.details.get("writeErrors", [])
+        for error in write_errors:
+            key = keys[error["index"]]
+            pending_counts.incr(key, counts[key])
+        print(f"❌ Error flushing analytics: {len(write_errors)} of {len(operations)} writes failed")
+        return len(operations) - len(write_errors)
+    except Exception as e:
+        # Put the counts back so they go out with the next flush
+        for key, count in counts.items():
+            pending_counts.incr(key, count)
+        print(f"❌ Error flushing analytics: {str(e)}")
+        return 0
+    return len(operations)
+
+def ensure_indexes():
+    """One bucket document per event, item and day"""
+    analytics_collection.create_index(
+        [("event", ASCENDING), ("item_id", ASCENDING), ("day", ASCENDING)],
+        unique=True
+    )
+    # top_items matches event by equality and day by range
+    analytics_collection.create_index([("event", ASCENDING), ("day", ASCENDING)])
+
+def top_items(event: str, since_day: str, limit: int) -> list[dict]:
+    """Sum daily buckets since a day and return the top items for an event"""
+    pipeline = [
+        {"$match": {"event": event, "day": {"$gte": since_day}}},
+        {"$group": {"_id": "$item_id", "count": {"$sum": "$count"}}},
+        {"$sort": {"count": -1}},
+        {"$limit": limit},
+    ]
+    return [
+        {"id": bucket["_id"], "count": bucket["count"]}
+        for bucket in analytics_collection.aggregate(pipeline)
+    ]
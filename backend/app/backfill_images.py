@@ -0,0 +1,45 @@
+# app/backfill_images.py
+"""
+Backfill image dimensions, dominant colour and placeholders on existing projects.
+
+Usage (from the backend folder):
+    python -m app.backfill_images [--workers 8] [--force]
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import app.config  # load .env before connecting to Mongo
+from app.database import projects_collection
+from app.images import get_image_metadata
+
+def backfill_project(project: dict) -> bool:
+    """Compute and store image metadata for a single project"""
+    image_metadata = get_image_metadata(project.get("image_url"))
+    if not image_metadata:
+        return False
+    try:
+        projects_collection.update_one({"_id": project["_id"]}, {"$set": image_metadata})
+    except Exception as e:
+        print(f"❌ Failed to save image metadata for {project['_id']}: {str(e)}")
+        return False
+    print(f"✓ Backfilled {project['_id']} ({image_metadata['image_width']}x{image_metadata['image_height']})")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill project image metadata")
+    parser.add_argument("--workers", type=int, default=8, help="Images processed in parallel")
+    parser.add_argument("--force", action="store_true", help="Recompute projects that already have metadata")
+    args = parser.parse_args()
+
+    query = {"image_url": {"$nin": [None, ""]}}
+    if not args.force:
+        query["image_width"] = {"$exists": False}
+    projects = projects_collection.find(query, {"image_url": 1})
+
+    # Fetching and decoding is mostly I/O and Pillow releases the GIL, so threads suffice
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(backfill_project, projects))
+
+    print(f"✓ Backfilled {sum(results)} of {len(results)} projects")
+
+if __name__ == "__main__":
+    main()
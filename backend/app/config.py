@@ -32,6 +32,15 @@ if not CLOUDINARY_CLOUD_NAME or not CLOUDINARY_API_KEY or not CLOUDINARY_API_SEC
     print(f"   CLOUDINARY_API_KEY: {'SET' if CLOUDINARY_API_KEY else 'NOT SET'}")
     print(f"   CLOUDINARY_API_SECRET: {'SET' if CLOUDINARY_API_SECRET else 'NOT SET'}")
 
+# Contact Spam Filtering Configuration
+SPAM_SCORE_THRESHOLD = float(getenv("SPAM_SCORE_THRESHOLD", "3.0"))
+CONTACT_DEDUP_WINDOW_SECONDS = int(getenv("CONTACT_DEDUP_WINDOW_SECONDS", "600"))  # 10 minutes
+CONTACT_MAX_PER_EMAIL = int(getenv("CONTACT_MAX_PER_EMAIL", "3"))  # per dedup window
+SPAM_WORKERS = int(getenv("SPAM_WORKERS", "2"))
+
+# Analytics Configuration
+ANALYTICS_FLUSH_SECONDS = int(getenv("ANALYTICS_FLUSH_SECONDS", "30"))
+
 # JWT Configuration
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24 hours
@@ -9,4 +9,5 @@ db = client["portfolio_db"]
 blogs_collection = db["blogs"]
 projects_collection = db["projects"]
 about_collection = db["about"]
-contacts_collection = db["contacts"]
\ No newline at end of file
+contacts_collection = db["contacts"]
+analytics_collection = db["analytics_daily"]
@@ -0,0 +1,69 @@
+# app/images.py
+import base64
+import io
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+from PIL import Image, ImageOps
+
+UPLOADS_DIR = Path("uploads")
+FETCH_TIMEOUT_SECONDS = 15
+MAX_FETCH_SIZE = 20 * 1024 * 1024  # 20MB
+PLACEHOLDER_SIZE = 16  # longest edge of the LQIP, in pixels
+
+# Fields written onto a project document by compute_image_metadata
+IMAGE_METADATA_FIELDS = ("image_width", "image_height", "image_color", "image_placeholder")
+
+def load_image_bytes(image_url: str) -> bytes:
+    """Read an image from the local uploads folder or over HTTP"""
+    if image_url.startswith("/uploads/"):
+        uploads_dir = UPLOADS_DIR.resolve()
+        path = (uploads_dir / image_url[len("/uploads/"):]).resolve()
+        if not path.is_relative_to(uploads_dir):
+            raise ValueError("Image path is outside the uploads folder")
+        return path.read_bytes()
+
+    if urlparse(image_url).scheme not in ("http", "https"):
+        raise ValueError("Image URL must be http or https")
+    request = Request(image_url, headers={"User-Agent": "portfolio-api"})
+    with urlopen(request, timeout=FETCH_TIMEOUT_SECONDS) as response:
+        contents = response.read(MAX_FETCH_SIZE + 1)
+    if len(contents) > MAX_FETCH_SIZE:
+        raise ValueError("Image exceeds 20MB limit")
+    return contents
+
+def compute_image_metadata(contents: bytes) -> dict:
+    """
+    Compute intrinsic size, dominant colour and a tiny base64 placeholder
+    for an image, so cards can reserve space and paint before it loads.
+    """
+    with Image.open(io.BytesIO(contents)) as image:
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        image = image.convert("RGB")
+
+        # Box-filter down to a single pixel for the average colour
+        r, g, b = image.resize((1, 1), Image.BOX).getpixel((0, 0))
+
+        thumbnail = image.copy()
+        thumbnail.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.BOX)
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, format="JPEG", quality=60)
+
+    placeholder = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return {
+        "image_width": width,
+        "image_height": height,
+        "image_color": f"#{r:02x}{g:02x}{b:02x}",
+        "image_placeholder": f"data:image/jpeg;base64,{placeholder}",
+    }
+
+def get_image_metadata(image_url: str) -> dict:
+    """Fetch an image by URL and compute its metadata, empty on failure"""
+    if not image_url:
+        return {}
+    try:
+        return compute_image_metadata(load_image_bytes(image_url))
+    except Exception as e:
+        print(f"❌ Failed to compute image metadata for {image_url}: {str(e)}")
+        return {}
@@ -1,13 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from app.config import FRONTEND_URL
+from app.config import FRONTEND_URL, ANALYTICS_FLUSH_SECONDS
+from app.analytics import ensure_indexes, flush_counts
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
+import asyncio
 
 # Import routes
-from app.routes import blogs, projects, about, contact, auth
+from app.routes import blogs, projects, about, contact, auth, backup, analytics
 
-app = FastAPI(title="Portfolio API", version="1.0.0")
+async def flush_analytics_periodically():
+    """Write buffered view/click counts to Mongo on a fixed interval"""
+    while True:
+        await asyncio.sleep(ANALYTICS_FLUSH_SECONDS)
+        await run_in_threadpool(flush_counts)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await run_in_threadpool(ensure_indexes)
+    except Exception as e:
+        print(f"❌ Error creating analytics indexes: {str(e)}")
+    flush_task = asyncio.create_task(flush_analytics_periodically())
+    yield
+    flush_task.cancel()
+    await run_in_threadpool(flush_counts)
+
+app = FastAPI(title="Portfolio API", version="1.0.0", lifespan=lifespan)
 
 # Disable automatic trailing slash redirect
 app.router.redirect_slashes = False
@@ -42,6 +63,8 @@ app.include_router(blogs.router, prefix="/api/blogs", tags=["blogs"])
 app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
 app.include_router(about.router, prefix="/api/about", tags=["about"])
 app.include_router(contact.router, prefix="/api/contact", tags=["contact"])
+app.include_router(backup.router, prefix="/api/backup", tags=["backup"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 
 # Mount static files AFTER routes
 Path("uploads").mkdir(exist_ok=True)
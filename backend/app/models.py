@@ -29,6 +29,10 @@ class ProjectCreate(ProjectBase):
 
 class Project(ProjectBase):
     id: str
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None
+    image_placeholder: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -52,6 +56,11 @@ class Contact(ContactBase):
     id: str
     created_at: datetime
 
+# Analytics Models
+class TrackEvent(BaseModel):
+    event: str
+    item_id: str
+
 # Auth Models
 class LoginRequest(BaseModel):
     password: str
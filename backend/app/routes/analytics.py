@@ -0,0 +1,73 @@
+from fastapi import APIRouter, HTTPException, Depends, Header
+from bson.objectid import ObjectId
+from datetime import datetime, timedelta
+from app.database import blogs_collection, projects_collection
+from app.models import TrackEvent
+from app.auth import verify_token
+from app.analytics import TRACKED_EVENTS, is_known_item, track_event, top_items
+from typing import Optional
+
+router = APIRouter()
+
+def get_token(authorization: Optional[str] = Header(None)) -> str:
+    """Extract and validate token from Authorization header"""
+    if not authorization:
+        raise HTTPException(status_code=401, detail="No token provided")
+    
+    try:
+        scheme, token = authorization.split()
+        if scheme.lower() != "bearer":
+            raise HTTPException(status_code=401, detail="Invalid auth scheme")
+        return token
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid authorization header")
+
+def with_titles(items: list[dict], collection) -> list[dict]:
+    """Attach titles to ranked items with a single lookup"""
+    object_ids = [ObjectId(item["id"]) for item in items]
+    titles = {
+        str(doc["_id"]): doc.get("title")
+        for doc in collection.find({"_id": {"$in": object_ids}}, {"title": 1})
+    }
+    return [{**item, "title": titles.get(item["id"])} for item in items]
+
+# TRACK a view or click (public)
+@router.post("/track")
+def track(event: TrackEvent):
+    if event.event not in TRACKED_EVENTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid event. Allowed: {', '.join(sorted(TRACKED_EVENTS))}"
+        )
+    if not ObjectId.is_valid(event.item_id):
+        raise HTTPException(status_code=400, detail="Invalid ID format")
+    try:
+        if not is_known_item(event.event, event.item_id):
+            raise HTTPException(status_code=404, detail="Item not found")
+        track_event(event.event, event.item_id)
+        return {"status": "ok"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error tracking event: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# GET top posts and projects (requires auth)
+@router.get("/top")
+def get_top(days: int = 30, limit: int = 10, token: str = Depends(get_token)):
+    try:
+        print(f"✓ Fetching top analytics with token: {token[:20]}...")
+        verify_token(token)
+        if days < 1 or days > 366 or limit < 1 or limit > 100:
+            raise HTTPException(status_code=400, detail="days must be between 1 and 366 and limit between 1 and 100")
+        since_day = (datetime.utcnow() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        return {
+            "since": since_day,
+            "posts": with_titles(top_items("blog_view", since_day, limit), blogs_collection),
+            "projects": with_titles(top_items("project_click", since_day, limit), projects_collection),
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error fetching analytics: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,218 @@
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from bson.objectid import ObjectId
+from datetime import datetime
+from pymongo import ReplaceOne
+from app.database import blogs_collection, projects_collection, contacts_collection
+from app.auth import verify_token
+from typing import Optional
+import csv
+import io
+import json
+
+router = APIRouter()
+
+# Collections that can be exported / restored, with the CSV columns for each
+BACKUP_COLLECTIONS = {
+    "contacts": (contacts_collection, ["id", "name", "email", "message", "spam_score", "is_spam", "created_at"]),
+    "blogs": (blogs_collection, ["id", "title", "excerpt", "content", "created_at", "updated_at"]),
+    "projects": (projects_collection, [
+        "id", "title", "description", "image_url", "github_link", "demo_link",
+        "image_width", "image_height", "image_color", "image_placeholder", "created_at", "updated_at"
+    ]),
+}
+DATETIME_FIELDS = {"created_at", "updated_at"}
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+EXPORT_BATCH_SIZE = 500  # documents pulled from Mongo per cursor round trip
+IMPORT_BATCH_SIZE = 500  # documents written per bulk_write
+
+def get_token(authorization: Optional[str] = Header(None)) -> str:
+    """Extract and validate token from Authorization header"""
+    if not authorization:
+        raise HTTPException(status_code=401, detail="No token provided")
+
+    try:
+        scheme, token = authorization.split()
+        if scheme.lower() != "bearer":
+            raise HTTPException(status_code=401, detail="Invalid auth scheme")
+        return token
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid authorization header")
+
+def get_backup_collection(name: str):
+    """Look up a backup-able collection by name"""
+    if name not in BACKUP_COLLECTIONS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown collection. Allowed: {', '.join(BACKUP_COLLECTIONS)}"
+        )
+    return BACKUP_COLLECTIONS[name]
+
+def serialize_document(doc: dict) -> dict:
+    """Convert a Mongo document into a JSON-safe dict"""
+    doc["id"] = str(doc.pop("_id"))
+    for key, value in doc.items():
+        if isinstance(value, datetime):
+            doc[key] = value.isoformat()
+        elif isinstance(value, ObjectId):
+            doc[key] = str(value)
+    return doc
+
+def deserialize_document(doc: dict) -> dict:
+    """Convert an exported dict back into a Mongo document"""
+    doc_id = doc.pop("id", None)
+    if doc_id:
+        doc["_id"] = ObjectId(doc_id)
+    for key in DATETIME_FIELDS:
+        if isinstance(doc.get(key), str):
+            doc[key] = datetime.fromisoformat(doc[key])
+    return doc
+
+def iter_documents(collection):
+    """Iterate a collection through a batched server-side cursor"""
+    cursor = collection.find().sort("_id", 1).batch_size(EXPORT_BATCH_SIZE)
+    try:
+        for doc in cursor:
+            yield serialize_document(doc)
+    finally:
+        cursor.close()
+
+def iter_ndjson(collection):
+    """Yield one JSON line per document"""
+    for doc in iter_documents(collection):
+        yield json.dumps(doc, default=str) + "\n"
+
+def escape_csv_cell(value):
+    """Stop spreadsheet apps from running a text cell as a formula"""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def iter_csv(collection, columns: list[str]):
+    """Yield CSV rows one document at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    for doc in iter_documents(collection):
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow({key: escape_csv_cell(value) for key, value in doc.items()})
+        yield buffer.getvalue()
+
+def write_batch(collection, batch: list[dict]) -> int:
+    """Upsert a batch of documents, keyed on _id when present"""
+    operations = []
+    new_docs = []
+    for doc in batch:
+        if "_id" in doc:
+            operations.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+        else:
+            new_docs.append(doc)
+    written = 0
+    if operations:
+        result = collection.bulk_write(operations, ordered=False)
+        written += result.upserted_count + result.matched_count
+    if new_docs:
+        result = collection.insert_many(new_docs, ordered=False)
+        written += len(result.inserted_ids)
+    return written
+
+# EXPORT collection as NDJSON or CSV (requires auth)
+@router.get("/{collection_name}/export")
+def export_collection(collection_name: str, format: str = "ndjson", token: str = Depends(get_token)):
+    try:
+        print(f"✓ Exporting {collection_name} as {format} with token: {token[:20]}...")
+        verify_token(token)
+        collection, columns = get_backup_collection(collection_name)
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+
+        if format == "ndjson":
+            body = iter_ndjson(collection)
+            media_type = "application/x-ndjson"
+        elif format == "csv":
+            body = iter_csv(collection, columns)
+            media_type = "text/csv"
+        else:
+            raise HTTPException(status_code=400, detail="Invalid format. Allowed: ndjson, csv")
+
+        filename = f"{collection_name}-{timestamp}.{format}"
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error exporting {collection_name}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# IMPORT collection from an NDJSON backup (requires auth)
+@router.post("/{collection_name}/import")
+async def import_collection(collection_name: str, request: Request, token: str = Depends(get_token)):
+    """
+    Restore documents from an NDJSON export.
+    The request body is read as a stream and written in batches,
+    documents with an existing id are replaced in place.
+    On an invalid line everything before it is written and nothing after,
+    the error reports the line and how many documents were imported.
+    """
+    imported = 0
+    line_number = 0
+    try:
+        print(f"✓ Importing {collection_name} with token: {token[:20]}...")
+        verify_token(token)
+        collection, _ = get_backup_collection(collection_name)
+
+        batch = []
+        pending = b""
+
+        async def flush():
+            nonlocal imported, batch
+            if batch:
+                imported += await run_in_threadpool(write_batch, collection, batch)
+                batch = []
+
+        async def parse_line(raw: bytes):
+            nonlocal line_number
+            line_number += 1
+            raw = raw.strip()
+            if not raw:
+                return
+            try:
+                batch.append(deserialize_document(json.loads(raw)))
+            except Exception as e:
+                await flush()
+                print(f"❌ Invalid record on line {line_number}, imported {imported} documents before it")
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "message": f"Invalid record on line {line_number}: {str(e)}",
+                        "line": line_number,
+                        "imported": imported,
+                    }
+                )
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush()
+
+        async for chunk in request.stream():
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                await parse_line(raw)
+        await parse_line(pending)
+        await flush()
+
+        print(f"✓ Imported {imported} documents into {collection_name}")
+        return {"message": f"Imported {imported} documents", "imported": imported}
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error importing {collection_name}: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail={"message": str(e), "line": line_number, "imported": imported}
+        )
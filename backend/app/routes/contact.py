@@ -4,7 +4,11 @@ from datetime import datetime
 from app.database import contacts_collection
 from app.models import Contact, ContactBase
 from app.auth import verify_token
+from app.config import SPAM_SCORE_THRESHOLD
+from app.spam import reserve_submission, release_submission, spam_score, spam_executor
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
+import asyncio
 
 router = APIRouter()
 
@@ -23,11 +27,12 @@ def get_token(authorization: Optional[str] = Header(None)) -> str:
 
 # GET all contact submissions (requires auth)
 @router.get("/")
-def get_contacts(token: str = Depends(get_token)):
+def get_contacts(include_spam: bool = False, token: str = Depends(get_token)):
     try:
         print(f"✓ Fetching contacts with token: {token[:20]}...")
         verify_token(token)
-        contacts = list(contacts_collection.find().sort("created_at", -1))
+        query = {} if include_spam else {"is_spam": {"$ne": True}}
+        contacts = list(contacts_collection.find(query).sort("created_at", -1))
         for contact in contacts:
             contact["id"] = str(contact["_id"])
             del contact["_id"]
@@ -40,15 +45,36 @@ def get_contacts(token: str = Depends(get_token)):
 
 # CREATE contact submission (public - for form submissions)
 @router.post("/")
-def create_contact(contact: ContactBase):
+async def create_contact(contact: ContactBase):
     try:
         print(f"✓ Creating contact submission")
         contact_data = contact.dict()
-        contact_data["created_at"] = datetime.utcnow()
-        result = contacts_collection.insert_one(contact_data)
-        contact_data["id"] = str(result.inserted_id)
-        del contact_data["_id"]
-        return contact_data
+
+        # Every path replies with the same body so senders can't probe the filter.
+        # The dedup check and reservation happen in one step, before any await,
+        # so a burst of identical submissions stores only one of them
+        if not reserve_submission(contact.email, contact.message):
+            print(f"✓ Duplicate contact submission dropped")
+            return {"message": "Message received"}
+
+        try:
+            # Likely spam is kept but flagged, and hidden from the inbox by default
+            loop = asyncio.get_running_loop()
+            score = await loop.run_in_executor(
+                spam_executor, spam_score, contact.name, contact.email, contact.message
+            )
+            contact_data["spam_score"] = score
+            contact_data["is_spam"] = score >= SPAM_SCORE_THRESHOLD
+            contact_data["created_at"] = datetime.utcnow()
+            await run_in_threadpool(contacts_collection.insert_one, contact_data)
+        except Exception:
+            # Not stored, so let the sender retry
+            release_submission(contact.email, contact.message)
+            raise
+
+        if contact_data["is_spam"]:
+            print(f"✓ Contact submission flagged as spam (score {score:.1f})")
+        return {"message": "Message received"}
     except Exception as e:
         print(f"❌ Error creating contact: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
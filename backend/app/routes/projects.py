@@ -4,6 +4,7 @@ from datetime import datetime
 from app.database import projects_collection
 from app.models import Project, ProjectCreate
 from app.auth import verify_token
+from app.images import get_image_metadata, IMAGE_METADATA_FIELDS
 from typing import Optional
 import os
 import cloudinary
@@ -44,6 +45,10 @@ def convert_to_object_id(id_str: str) -> ObjectId:
         print(f"❌ Invalid ID format: {id_str}")
         raise HTTPException(status_code=400, detail="Invalid ID format")
 
+def without_placeholder(project: dict) -> dict:
+    """Copy of a project for logging, minus the base64 image placeholder"""
+    return {key: value for key, value in project.items() if key != "image_placeholder"}
+
 # UPLOAD image (requires auth)
 @router.post("/upload")
 async def upload_image(file: UploadFile = File(...), token: str = Depends(get_token)):
@@ -142,6 +147,7 @@ def create_project(project: ProjectCreate, token: str = Depends(get_token)):
         verify_token(token)
         project_data = project.dict(exclude_unset=False)
         print(f"✓ Project data to create: {project_data}")
+        project_data.update(get_image_metadata(project_data["image_url"]))
         project_data["created_at"] = datetime.utcnow()
         project_data["updated_at"] = datetime.utcnow()
         result = projects_collection.insert_one(project_data)
@@ -173,12 +179,23 @@ def update_project(project_id: str, project: ProjectCreate, token: str = Depends
         if "demo_link" not in project_data:
             project_data["demo_link"] = project.demo_link or ""
         
-        print(f"✓ Final data to save: {project_data}")
+        existing_project = projects_collection.find_one({"_id": object_id}, {"image_url": 1, "image_width": 1})
+        if not existing_project:
+            print(f"❌ Project not found with ID: {project_id}")
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        # Only recompute image metadata when the image actually changed
+        update = {"$set": project_data}
+        if existing_project.get("image_url") != project_data["image_url"] or "image_width" not in existing_project:
+            image_metadata = get_image_metadata(project_data["image_url"])
+            project_data.update(image_metadata)
+            stale_fields = {field: "" for field in IMAGE_METADATA_FIELDS if field not in image_metadata}
+            if stale_fields:
+                update["$unset"] = stale_fields
+        
+        print(f"✓ Final data to save: {without_placeholder(project_data)}")
         
-        result = projects_collection.update_one(
-            {"_id": object_id},
-            {"$set": project_data}
-        )
+        result = projects_collection.update_one({"_id": object_id}, update)
         
         if result.matched_count == 0:
             print(f"❌ Project not found with ID: {project_id}")
@@ -189,7 +206,7 @@ def update_project(project_id: str, project: ProjectCreate, token: str = Depends
         if updated_project:
             updated_project["id"] = str(updated_project["_id"])
             del updated_project["_id"]
-            print(f"✓ Project updated successfully: {updated_project}")
+            print(f"✓ Project updated successfully: {without_placeholder(updated_project)}")
             return updated_project
         else:
             print(f"✓ Project updated successfully")
@@ -0,0 +1,134 @@
+# app/spam.py
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from app.config import CONTACT_DEDUP_WINDOW_SECONDS, CONTACT_MAX_PER_EMAIL, SPAM_WORKERS
+
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+", re.IGNORECASE)  # one match per link
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+REPEATED_CHAR_PATTERN = re.compile(r"(.)\1{5,}")
+
+# Tokens that rarely show up in a genuine portfolio enquiry
+SPAM_TOKENS = {
+    "casino", "crypto", "bitcoin", "forex", "viagra", "cialis", "loan", "loans",
+    "seo", "backlinks", "backlink", "guaranteed", "investment", "earn",
+    "winner", "prize", "unsubscribe", "promo", "discount", "cheap", "escort", "adult",
+}
+
+spam_executor = ThreadPoolExecutor(max_workers=SPAM_WORKERS, thread_name_prefix="spam")
+
+class DedupWindow:
+    """Bounded, time-windowed counter of recently seen keys"""
+
+    def __init__(self, window_seconds: int, max_entries: int = 10000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (first_seen, count), oldest first
+        self._lock = Lock()
+
+    def _evict(self, now: float):
+        while self._entries:
+            key, (first_seen, _) = next(iter(self._entries.items()))
+            if now - first_seen < self.window_seconds and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def try_hit(self, key: str, limit: int = 1) -> bool:
+        """Record a key unless it was already seen `limit` times, in one locked step"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            first_seen, count = self._entries.get(key, (now, 0))
+            if count >= limit:
+                return False
+            self._entries[key] = (first_seen, count + 1)
+            return True
+
+    def release(self, key: str):
+        """Undo one try_hit for a key"""
+        with self._lock:
+            if key not in self._entries:
+                return
+            first_seen, count = self._entries[key]
+            if count <= 1:
+                del self._entries[key]
+            else:
+                self._entries[key] = (first_seen, count - 1)
+
+content_window = DedupWindow(CONTACT_DEDUP_WINDOW_SECONDS)
+email_window = DedupWindow(CONTACT_DEDUP_WINDOW_SECONDS)
+
+def normalize_email(email: str) -> str:
+    """Lowercase an email and strip +tags (and dots for Gmail)"""
+    local, _, domain = email.strip().lower().partition("@")
+    local = local.split("+", 1)[0]
+    if domain in ("gmail.com", "googlemail.com"):
+        local = local.replace(".", "")
+        domain = "gmail.com"
+    return f"{local}@{domain}"
+
+def content_hash(email: str, message: str) -> str:
+    """Hash a sender and message with case and whitespace normalized away"""
+    normalized = " ".join(message.lower().split())
+    return hashlib.sha256(f"{email}\n{normalized}".encode("utf-8")).hexdigest()
+
+def reserve_submission(email: str, message: str) -> bool:
+    """
+    Claim a slot in the content and per-email dedup windows.
+    Returns False for a duplicate; call release_submission if the
+    submission ends up not being stored.
+    """
+    email = normalize_email(email)
+    if not content_window.try_hit(content_hash(email, message)):
+        return False
+    if not email_window.try_hit(email, CONTACT_MAX_PER_EMAIL):
+        content_window.release(content_hash(email, message))
+        return False
+    return True
+
+def release_submission(email: str, message: str):
+    """Give back a reservation so the sender can retry"""
+    email = normalize_email(email)
+    content_window.release(content_hash(email, message))
+    email_window.release(email)
+
+def spam_score(name: str, email: str, message: str) -> float:
+    """
+    Cheap heuristic spam score for a contact submission.
+    Higher is spammier; each signal adds a fixed weight.
+    """
+    score = 0.0
+    tokens = TOKEN_PATTERN.findall(message.lower())
+
+    # Links in the message, and any link at all in the name
+    score += min(len(URL_PATTERN.findall(message)), 4) * 1.0
+    if URL_PATTERN.search(name):
+        score += 3.0
+
+    # Known spam vocabulary
+    if tokens:
+        spam_hits = sum(1 for token in tokens if token in SPAM_TOKENS)
+        score += min(spam_hits, 5) * 0.8
+        if len(set(tokens)) / len(tokens) < 0.3 and len(tokens) > 20:
+            score += 1.5  # the same few words repeated over and over
+
+    # Shouting and keyboard mashing
+    letters = [c for c in message if c.isalpha()]
+    if len(letters) > 20 and sum(1 for c in letters if c.isupper()) / len(letters) > 0.6:
+        score += 1.5
+    if REPEATED_CHAR_PATTERN.search(message):
+        score += 1.0
+
+    # Too short to be a real enquiry
+    if len(tokens) < 3:
+        score += 1.0
+
+    # Throwaway-looking addresses
+    local = email.partition("@")[0]
+    if sum(c.isdigit() for c in local) >= 5:
+        score += 1.0
+
+    return score
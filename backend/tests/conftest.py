@@ -0,0 +1,5 @@
+import os
+
+# app.config refuses to import without these; no server is contacted
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("ADMIN_PASSWORD", "test-password")
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from app.models import ContactBase
+from app.routes import contact
+from app import spam
+
+class FakeCollection:
+    """Records inserts; a slow insert_one widens the race window"""
+
+    def __init__(self, fail=False):
+        self.docs = []
+        self.fail = fail
+
+    def insert_one(self, doc):
+        time.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("insert failed")
+        self.docs.append(doc)
+
+def reset_windows(monkeypatch):
+    monkeypatch.setattr(spam, "content_window", spam.DedupWindow(600))
+    monkeypatch.setattr(spam, "email_window", spam.DedupWindow(600))
+
+def submission(message="Hi, I'd like to talk about a frontend role on our team."):
+    return ContactBase(name="Ann", email="ann@example.com", message=message)
+
+def test_concurrent_identical_submissions_store_one(monkeypatch):
+    reset_windows(monkeypatch)
+    collection = FakeCollection()
+    monkeypatch.setattr(contact, "contacts_collection", collection)
+
+    async def burst():
+        return await asyncio.gather(*(contact.create_contact(submission()) for _ in range(10)))
+
+    responses = asyncio.run(burst())
+
+    assert len(collection.docs) == 1
+    assert all(response == {"message": "Message received"} for response in responses)
+
+def test_failed_insert_can_be_retried(monkeypatch):
+    reset_windows(monkeypatch)
+    collection = FakeCollection(fail=True)
+    monkeypatch.setattr(contact, "contacts_collection", collection)
+
+    try:
+        asyncio.run(contact.create_contact(submission()))
+    except Exception:
+        pass
+
+    collection.fail = False
+    asyncio.run(contact.create_contact(submission()))
+    assert len(collection.docs) == 1
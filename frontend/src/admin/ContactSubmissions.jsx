@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { contactAPI } from '../utils/api';
+import { contactAPI, backupAPI } from '../utils/api';
 import '../styles/admin.css';
 
 export default function ContactSubmissions() {
@@ -36,11 +36,29 @@ export default function ContactSubmissions() {
     }
   };
 
+  const handleExport = async () => {
+    try {
+      const response = await backupAPI.export('contacts', 'csv');
+      const url = URL.createObjectURL(response.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `contacts-${new Date().toISOString().slice(0, 10)}.csv`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (err) {
+      setError('Failed to export submissions');
+      console.error(err);
+    }
+  };
+
   if (loading) return <div className="loading">Loading submissions...</div>;
 
   return (
     <div className="manager">
       <h2>Contact Form Submissions</h2>
+      <button className="btn-primary" onClick={handleExport}>
+        Export CSV
+      </button>
       {error && <div className="error-message">{error}</div>}
 
       <div className="submissions-list">
@@ -1,5 +1,5 @@
 import { useEffect, useState } from 'react';
-import { blogsAPI } from '../utils/api';
+import { blogsAPI, analyticsAPI } from '../utils/api';
 import '../styles/pages.css';
 
 export default function Blog() {
@@ -72,7 +72,10 @@ export default function Blog() {
                 <p className="blog-excerpt">{blog.excerpt}</p>
                 <button
                   className="read-more"
-                  onClick={() => setSelectedBlog(blog)}
+                  onClick={() => {
+                    setSelectedBlog(blog);
+                    analyticsAPI.track('blog_view', blog.id);
+                  }}
                 >
                   Read More →
                 </button>
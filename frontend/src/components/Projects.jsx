@@ -1,5 +1,5 @@
 import { useEffect, useState } from 'react';
-import { projectsAPI } from '../utils/api';
+import { projectsAPI, analyticsAPI } from '../utils/api';
 import '../styles/pages.css';
 
 // Helper function to convert relative URLs to absolute
@@ -53,6 +53,14 @@ export default function Projects() {
                 <img 
                   src={getFullImageUrl(project.image_url)} 
                   alt={project.title} 
+                  loading="lazy"
+                  decoding="async"
+                  style={{
+                    backgroundColor: project.image_color,
+                    backgroundImage: project.image_placeholder ? `url(${project.image_placeholder})` : undefined,
+                    backgroundSize: 'cover',
+                    backgroundPosition: 'center',
+                  }}
                   onError={(e) => {
                     console.error('Failed to load image:', getFullImageUrl(project.image_url));
                     e.target.style.display = 'none';
@@ -69,6 +77,7 @@ export default function Projects() {
                       target="_blank"
                       rel="noopener noreferrer"
                       className="project-link"
+                      onClick={() => analyticsAPI.track('project_click', project.id)}
                     >
                       View Project →
                     </a>
@@ -78,6 +87,7 @@ export default function Projects() {
                     target="_blank"
                     rel="noopener noreferrer"
                     className="project-link"
+                    onClick={() => analyticsAPI.track('project_click', project.id)}
                   >
                     View on GitHub →
                   </a>
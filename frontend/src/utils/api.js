@@ -116,6 +116,19 @@ export const contactAPI = {
     api.delete(`/api/contact/${id}/`),
 };
 
+// ============== Backup API ==============
+export const backupAPI = {
+  export: (collection, format = 'ndjson') =>
+    api.get(`/api/backup/${collection}/export`, { params: { format }, responseType: 'blob' }),
+};
+
+// ============== Analytics API ==============
+export const analyticsAPI = {
+  // Fire-and-forget; tracking failures should never surface to visitors
+  track: (event, itemId) =>
+    api.post('/api/analytics/track', { event, item_id: itemId }).catch(() => {}),
+};
+
 // ============== Error Handling Utility ==============
 export const handleApiError = (error) => {
   if (error.response) {